@@ -120,5 +120,7 @@ class SpeechRecognition(Task):
         input_cls: Optional[Type[ServeInput]] = SpeechRecognitionDeserializer,
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
+        torch_compile: bool = False,
+        quantize: bool = False,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs)
+        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, torch_compile, quantize)
@@ -11,7 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import functools
 import os
 import sys
 from copy import copy, deepcopy
@@ -100,6 +99,8 @@ def _has_len(data: Union[Sequence, Iterable]) -> bool:
     Args:
         data: The object to check for length support.
     """
+    if isinstance(data, (list, tuple, dict)):
+        return True
     try:
         len(data)
         return True
@@ -114,42 +115,31 @@ def _validate_input(input: "InputBase") -> None:
     Args:
         input: The ``InputBase`` instance to validate.
 
+    Inputs in the ``SERVING`` stage are not validated as they are constructed on the serving path.
+
     Raises:
         RuntimeError: If the ``input`` is of type ``Input`` and it's ``data`` attribute does not support ``len``.
         RuntimeError: If the ``input`` is of type ``IterableInput`` and it's ``data`` attribute does support ``len``.
     """
-    if input.data is not None:
+    if input.data is not None and input.running_stage != RunningStage.SERVING:
         if isinstance(input, Input) and not _has_len(input.data):
             raise RuntimeError("`Input.data` is not a sequence with a defined length. Use `IterableInput` instead.")
         elif isinstance(input, IterableInput) and _has_len(input.data):
             raise RuntimeError("`IterableInput.data` is a sequence with a defined length. Use `Input` instead.")
 
 
-def _wrap_init(class_dict: Dict[str, Any]) -> None:
-    """Helper function to wrap the ``__init__`` (if present) from a class construction dict to apply the
-    ``_validate_input`` function after instantiation. Modifies the dict inplace.
-
-    Args:
-        class_dict: The class construction dict, optionally containing an init to wrap.
-    """
-    if "__init__" in class_dict:
-        fn = class_dict["__init__"]
-
-        @functools.wraps(fn)
-        def wrapper(self, *args, **kwargs):
-            fn(self, *args, **kwargs)
-            _validate_input(self)
-
-        class_dict["__init__"] = wrapper
+# Attributes of ``InputBase`` which are shared between an input and its deep copies
+_DEEPCOPY_SHARED_ATTRIBUTES = frozenset({"transform", "input_transforms_registry", "_data_pipeline_state"})
 
 
 class _InputMeta(GenericMeta):
-    """Metaclass for the ``InputBase`` which wraps any init defined in a subclass with the ``_validate_input``
-    helper."""
+    """Metaclass for the ``InputBase`` which applies the ``_validate_input`` helper once an instance has been fully
+    constructed (i.e. after the ``__init__`` of the most derived class has returned)."""
 
-    def __new__(mcs, name: str, bases: Tuple, class_dict: Dict[str, Any]) -> "_InputMeta":
-        _wrap_init(class_dict)
-        return cast(_InputMeta, super().__new__(mcs, name, bases, class_dict))
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        input = super().__call__(*args, **kwargs)
+        _validate_input(input)
+        return input
 
 
 class _IterableInputMeta(_InputMeta, type(IterableDataset)):
@@ -221,19 +211,25 @@ class InputBase(Properties, metaclass=_InputMeta):
         )
         return load_data(*args, **kwargs)
 
-    def _call_load_sample(self, sample: Any) -> Any:
-        from flash.core.data.data_pipeline import DataPipeline
+    def _resolve_load_sample(self) -> Tuple[str, bool]:
+        """Resolve the name of the ``load_sample`` hook to use for the current running stage and whether the sample
+        needs to be copied before it is passed to the hook (only the default identity hook doesn't need a copy). The
+        name is cached (keyed by the running stage) as it is needed for every sample."""
+        running_stage = self.running_stage
+        resolved = getattr(self, "_resolved_load_sample", None)
+        if resolved is None or resolved[0] != running_stage:
+            from flash.core.data.data_pipeline import DataPipeline
+
+            name = DataPipeline._resolve_function_hierarchy("load_sample", self, running_stage, InputBase)
+            resolved = (running_stage, name, getattr(type(self), name, None) is InputBase.load_sample)
+            self._resolved_load_sample = resolved
+        _, name, is_default = resolved
+        # A hook assigned on the instance shadows the class attribute, so it always receives a copy
+        return name, not is_default or name in self.__dict__
 
-        load_sample = getattr(
-            self,
-            DataPipeline._resolve_function_hierarchy(
-                "load_sample",
-                self,
-                self.running_stage,
-                InputBase,
-            ),
-        )
-        return load_sample(copy(sample))
+    def _call_load_sample(self, sample: Any) -> Any:
+        name, needs_copy = self._resolve_load_sample()
+        return getattr(self, name)(copy(sample) if needs_copy else sample)
 
     @staticmethod
     def load_data(*args: Any, **kwargs: Any) -> Union[Sequence, Iterable]:
@@ -250,7 +246,8 @@ class InputBase(Properties, metaclass=_InputMeta):
     @staticmethod
     def load_sample(sample: MutableMapping[str, Any]) -> Any:
         """The ``load_sample`` hook is called for each ``__getitem__`` or ``__next__`` call to the dataset with a
-        single sample from the output of the ``load_data`` hook as input.
+        single sample from the output of the ``load_data`` hook as input. Overrides of this hook receive a shallow
+        copy of the sample, so they can safely modify it in place.
 
         Args:
             sample: A single sample from the output of the ``load_data`` hook.
@@ -286,12 +283,17 @@ class InputBase(Properties, metaclass=_InputMeta):
 
     def __deepcopy__(self, memo):
         """The default deepcopy implementation seems to use ``__getstate__`` and ``__setstate__`` so we override it
-        here with a custom implementation to ensure that it includes the data list."""
+        here with a custom implementation to ensure that it includes the data list.
+
+        The transform, the transforms registry, and the ``DataPipelineState`` are shared with the copy rather than
+        deep copied. They don't hold any per-sample state and the ``DataPipelineState`` is intended to be shared by
+        all of the inputs of a ``DataModule``.
+        """
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
+            setattr(result, k, v if k in _DEEPCOPY_SHARED_ATTRIBUTES else deepcopy(v, memo))
         return result
 
     def __bool__(self):
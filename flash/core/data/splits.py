@@ -39,12 +39,11 @@ class SplitDataset(Properties, Dataset):
         if not isinstance(indices, list):
             raise MisconfigurationException("indices should be a list")
 
-        if use_duplicated_indices:
-            indices = list(indices)
-        else:
-            indices = list(np.unique(indices))
+        indices = np.asarray(indices, dtype=np.int64)
+        if not use_duplicated_indices:
+            indices = np.unique(indices)
 
-        if np.max(indices) >= len(dataset) or np.min(indices) < 0:
+        if indices.size and (indices.max() >= len(dataset) or indices.min() < 0):
             raise MisconfigurationException(f"`indices` should be within [0, {len(dataset) -1}].")
 
         self.dataset = dataset
@@ -56,12 +55,13 @@ class SplitDataset(Properties, Dataset):
             self.dataset.attach_data_pipeline_state(data_pipeline_state)
 
     def __getattr__(self, key: str):
-        if key != "dataset":
+        # Dunder lookups (e.g. ``__array__`` or ``__getstate__`` probes) are never forwarded to the wrapped dataset
+        if key != "dataset" and not (key.startswith("__") and key.endswith("__")):
             return getattr(self.dataset, key)
-        raise AttributeError
+        raise AttributeError(key)
 
     def __getitem__(self, index: int) -> Any:
-        return self.dataset[self.indices[index]]
+        return self.dataset[int(self.indices[index])]
 
     def __len__(self) -> int:
         return len(self.indices)
@@ -12,8 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from enum import auto, Enum
-from functools import reduce
-from typing import Any, cast, List, Optional, Tuple, Union
+from typing import Any, cast, Iterable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import torch
@@ -22,6 +21,16 @@ from flash.core.data.utilities.sort import sorted_alphanumeric
 
 
 def _is_list_like(x: Any) -> bool:
+    if isinstance(x, (list, tuple)):
+        return len(x) > 0
+    if isinstance(x, np.ndarray) or torch.is_tensor(x):
+        return x.ndim > 0 and len(x) > 0
+    if isinstance(x, (int, float, np.generic)):
+        return False
+    return _is_list_like_slow(x)
+
+
+def _is_list_like_slow(x: Any) -> bool:
     try:
         _ = x[0]
         _ = len(x)
@@ -40,6 +49,23 @@ def _strip(x: str) -> str:
     return x.strip(", ")
 
 
+def _is_binary(x: np.ndarray) -> bool:
+    return x.dtype.kind in "biuf" and bool(np.logical_or(x == 0, x == 1).all())
+
+
+def _as_numeric_array(x: Any) -> Optional[np.ndarray]:
+    """Convert ``x`` to a numeric NumPy array, or return ``None`` if it can't be converted (e.g. a list of CUDA
+    tensors, ragged lists or non-numeric values)."""
+    if torch.is_tensor(x):
+        x = x.cpu().numpy()
+    elif not isinstance(x, np.ndarray):
+        try:
+            x = np.asarray(x)
+        except (TypeError, ValueError):
+            return None
+    return x if x.dtype.kind in "biuf" else None
+
+
 class TargetMode(Enum):
     """The ``TargetMode`` Enum describes the different supported formats for targets in Flash."""
 
@@ -84,8 +110,15 @@ class TargetMode(Enum):
             if isinstance(target[0], str):
                 return TargetMode.MULTI_TOKEN
             elif len(target) > 1:
-                if all(t == 0 or t == 1 for t in target):
-                    if sum(target) == 1:
+                # Convert once so that the binary check and the sum are both single vectorized passes
+                array = _as_numeric_array(target)
+                if array is None:
+                    if all(t == 0 or t == 1 for t in target):
+                        if sum(target) == 1:
+                            return TargetMode.SINGLE_BINARY
+                        return TargetMode.MULTI_BINARY
+                elif array.ndim == 1 and _is_binary(array):
+                    if array.sum() == 1:
                         return TargetMode.SINGLE_BINARY
                     return TargetMode.MULTI_BINARY
                 return TargetMode.MULTI_NUMERIC
@@ -93,35 +126,29 @@ class TargetMode(Enum):
 
     @property
     def multi_label(self) -> bool:
-        return any(
-            [
-                self is TargetMode.MUTLI_COMMA_DELIMITED,
-                self is TargetMode.MUTLI_SPACE_DELIMITED,
-                self is TargetMode.MULTI_NUMERIC,
-                self is TargetMode.MULTI_TOKEN,
-                self is TargetMode.MULTI_BINARY,
-            ]
-        )
+        return self in _MULTI_LABEL_TARGET_MODES
 
     @property
     def numeric(self) -> bool:
-        return any(
-            [
-                self is TargetMode.MULTI_NUMERIC,
-                self is TargetMode.SINGLE_NUMERIC,
-            ]
-        )
+        return self in _NUMERIC_TARGET_MODES
 
     @property
     def binary(self) -> bool:
-        return any(
-            [
-                self is TargetMode.MULTI_BINARY,
-                self is TargetMode.SINGLE_BINARY,
-            ]
-        )
+        return self in _BINARY_TARGET_MODES
 
 
+_MULTI_LABEL_TARGET_MODES = frozenset(
+    {
+        TargetMode.MUTLI_COMMA_DELIMITED,
+        TargetMode.MUTLI_SPACE_DELIMITED,
+        TargetMode.MULTI_NUMERIC,
+        TargetMode.MULTI_TOKEN,
+        TargetMode.MULTI_BINARY,
+    }
+)
+_NUMERIC_TARGET_MODES = frozenset({TargetMode.MULTI_NUMERIC, TargetMode.SINGLE_NUMERIC})
+_BINARY_TARGET_MODES = frozenset({TargetMode.MULTI_BINARY, TargetMode.SINGLE_BINARY})
+
 _RESOLUTION_MAPPING = {
     TargetMode.MULTI_BINARY: [TargetMode.MULTI_NUMERIC],
     TargetMode.SINGLE_BINARY: [TargetMode.MULTI_BINARY, TargetMode.MULTI_NUMERIC],
@@ -151,23 +178,74 @@ def _resolve_target_mode(a: TargetMode, b: TargetMode) -> TargetMode:
     )
 
 
-def get_target_mode(targets: List[Any]) -> TargetMode:
+def get_target_mode(targets: Iterable[Any]) -> TargetMode:
     """Aggregate the ``TargetMode`` for a list of targets.
 
     Args:
-        targets: The list of targets to get the label mode for.
+        targets: The list (or other iterable) of targets to get the label mode for.
 
     Returns:
         The total ``TargetMode`` of the list of targets.
     """
+    if not isinstance(targets, (Sequence, np.ndarray)) and not torch.is_tensor(targets):
+        # Generators, sets, etc. can't be indexed (and may only be iterated once), so collect them first
+        targets = list(targets)
+    target_mode = _get_array_target_mode(targets)
+    if target_mode is not None:
+        return target_mode
     targets = _as_list(targets)
-    return reduce(_resolve_target_mode, [TargetMode.from_target(target) for target in targets])
+    if len(targets) == 0:
+        raise ValueError("Expected at least one target to determine the target mode from.")
+
+    # String targets are typically repeated many times (e.g. one label per sample), so cache their modes
+    token_modes = {}
+    target_mode = None
+    for target in targets:
+        if isinstance(target, str):
+            mode = token_modes.get(target)
+            if mode is None:
+                mode = token_modes[target] = TargetMode.from_target(target)
+        else:
+            mode = TargetMode.from_target(target)
+
+        if target_mode is None:
+            target_mode = mode
+        elif mode is not target_mode:
+            target_mode = _resolve_target_mode(target_mode, mode)
+    return target_mode
+
+
+def _get_array_target_mode(targets: Union[Sequence[Any], torch.Tensor, np.ndarray]) -> Optional[TargetMode]:
+    """Determine the ``TargetMode`` of a homogeneous collection of numeric targets in a single vectorized pass.
+    This gives the same result as reducing over ``TargetMode.from_target`` for each target.
+
+    Returns:
+        The ``TargetMode`` or ``None`` if the targets are not a 1D or 2D numeric array (e.g. strings or ragged lists).
+    """
+    if not torch.is_tensor(targets) and not isinstance(targets, np.ndarray):
+        if not isinstance(targets, Sequence) or len(targets) == 0 or isinstance(targets[0], str):
+            return None
+    targets = _as_numeric_array(targets)
+
+    if targets is None or targets.size == 0:
+        return None
+    if targets.ndim == 1 or (targets.ndim == 2 and targets.shape[1] == 1):
+        return TargetMode.SINGLE_NUMERIC
+    if targets.ndim == 2:
+        if _is_binary(targets):
+            if (targets.sum(axis=1) == 1).all():
+                return TargetMode.SINGLE_BINARY
+            return TargetMode.MULTI_BINARY
+        return TargetMode.MULTI_NUMERIC
+    return None
 
 
 class TargetFormatter:
     """A ``TargetFormatter`` is used to convert targets of a given type to a standard format required by the
     task."""
 
+    __slots__ = ()
+
     def __call__(self, target: Any) -> Any:
         return self.format(target)
 
@@ -176,6 +254,8 @@ class TargetFormatter:
 
 
 class SingleNumericTargetFormatter(TargetFormatter):
+    __slots__ = ()
+
     def format(self, target: Any) -> Any:
         result = super().format(target)
         if _is_list_like(result):
@@ -184,54 +264,79 @@ class SingleNumericTargetFormatter(TargetFormatter):
 
 
 class SingleLabelTargetFormatter(TargetFormatter):
+    __slots__ = ("label_to_idx",)
+
     def __init__(self, labels: List[Any]):
         self.label_to_idx = {label: idx for idx, label in enumerate(labels)}
 
     def format(self, target: Any) -> Any:
-        return self.label_to_idx[_strip(target[0] if not isinstance(target, str) else target)]
+        if not isinstance(target, str):
+            target = target[0]
+        # Most targets are already stripped, so only strip if the direct lookup misses
+        idx = self.label_to_idx.get(target)
+        if idx is None:
+            idx = self.label_to_idx[_strip(target)]
+        return idx
 
 
 class MultiLabelTargetFormatter(SingleLabelTargetFormatter):
+    __slots__ = ("num_classes", "_zeros")
+
     def __init__(self, labels: List[Any]):
         super().__init__(labels)
 
         self.num_classes = len(labels)
+        self._zeros = [0] * self.num_classes
 
     def format(self, target: Any) -> Any:
-        result = [0] * self.num_classes
+        result = self._zeros.copy()
+        label_to_idx = self.label_to_idx
         for t in target:
-            idx = super().format(t)
-            result[idx] = 1
+            # Equivalent to ``_strip(t)`` without the extra function call per token
+            result[label_to_idx[t.strip(", ")]] = 1
         return result
 
 
 class CommaDelimitedTargetFormatter(MultiLabelTargetFormatter):
+    __slots__ = ()
+
     def format(self, target: Any) -> Any:
         return super().format(target.split(","))
 
 
 class SpaceDelimitedTargetFormatter(MultiLabelTargetFormatter):
+    __slots__ = ()
+
     def format(self, target: Any) -> Any:
         return super().format(target.split(" "))
 
 
 class MultiNumericTargetFormatter(TargetFormatter):
+    __slots__ = ("num_classes", "_zeros")
+
     def __init__(self, num_classes: int):
         self.num_classes = num_classes
+        self._zeros = [0] * self.num_classes
 
     def format(self, target: Any) -> Any:
-        result = [0] * self.num_classes
+        result = self._zeros.copy()
         for idx in target:
             result[idx] = 1
         return result
 
 
 class OneHotTargetFormatter(TargetFormatter):
+    __slots__ = ()
+
     def format(self, target: Any) -> Any:
-        for idx, t in enumerate(target):
-            if t == 1:
-                return idx
-        return 0
+        if isinstance(target, np.ndarray):
+            # ``argmax`` of a boolean array returns the first ``True`` index, or zero if there isn't one
+            return int(np.argmax(target == 1))
+        try:
+            # For (small) tensors, converting to a list is much cheaper than a round trip through NumPy
+            return (target.tolist() if torch.is_tensor(target) else list(target)).index(1)
+        except ValueError:
+            return 0
 
 
 def get_target_formatter(
@@ -284,15 +389,17 @@ def get_target_details(targets: List[Any], target_mode: TargetMode) -> Tuple[Opt
     if target_mode.numeric:
         # Take a max over all values
         if target_mode is TargetMode.MULTI_NUMERIC:
-            values = []
-            for target in targets:
-                values.extend(target)
+            # Stream the max over the (non-empty) targets rather than materializing all of the values
+            num_classes = max(map(max, filter(len, targets)))
         else:
-            values = targets
-        num_classes = _as_list(max(values))
-        if _is_list_like(num_classes):
-            num_classes = num_classes[0]
-        num_classes = num_classes + 1
+            values = _as_numeric_array(targets)
+            if values is not None:
+                num_classes = values.max()
+            else:
+                num_classes = _as_list(max(targets))
+                if _is_list_like(num_classes):
+                    num_classes = num_classes[0]
+        num_classes = int(num_classes) + 1
         labels = None
     elif target_mode.binary:
         # Take a length
@@ -300,21 +407,16 @@ def get_target_details(targets: List[Any], target_mode: TargetMode) -> Tuple[Opt
         num_classes = len(targets[0])
         labels = None
     else:
-        # Compute tokens
-        tokens = []
+        # Compute the unique (stripped) tokens in a single pass
         if target_mode is TargetMode.MUTLI_COMMA_DELIMITED:
-            for target in targets:
-                tokens.extend(target.split(","))
+            tokens = {token.strip(", ") for target in targets for token in target.split(",")}
         elif target_mode is TargetMode.MUTLI_SPACE_DELIMITED:
-            for target in targets:
-                tokens.extend(target.split(" "))
+            tokens = {token.strip(", ") for target in targets for token in target.split(" ")}
         elif target_mode is TargetMode.MULTI_TOKEN:
-            for target in targets:
-                tokens.extend(target)
+            tokens = {token.strip(", ") for target in targets for token in target}
         else:
-            tokens = targets
+            tokens = {token.strip(", ") for token in targets}
 
-        tokens = [_strip(token) for token in tokens]
-        labels = list(sorted_alphanumeric(set(tokens)))
+        labels = list(sorted_alphanumeric(tokens))
         num_classes = len(labels)
     return labels, num_classes
@@ -19,26 +19,31 @@ import pandas as pd
 from pytorch_lightning.utilities import rank_zero_warn
 
 from flash.core.data.utilities.paths import PATH_TYPE
-from flash.core.utilities.imports import _PANDAS_GREATER_EQUAL_1_3_0
+from flash.core.utilities.imports import _PANDAS_GREATER_EQUAL_1_3_0, _PANDAS_GREATER_EQUAL_1_4_0, _PYARROW_AVAILABLE
 
 
-def read_csv(file: PATH_TYPE) -> pd.DataFrame:
+def read_csv(file: PATH_TYPE, usecols: Optional[List[str]] = None, engine: Optional[str] = None) -> pd.DataFrame:
     """A wrapper for ``pd.read_csv`` which tries to handle errors gracefully.
 
     Args:
         file: The CSV file to read.
+        usecols: If given, only these columns will be parsed from the file.
+        engine: The ``pd.read_csv`` parser engine to use. Set to ``"pyarrow"`` to use the multi-threaded PyArrow parser
+            (requires ``pyarrow`` and ``pandas>=1.4``), which is much faster for large CSV files.
 
     Returns:
         A ``DataFrame`` containing the contents of the file.
     """
+    if engine == "pyarrow" and not (_PYARROW_AVAILABLE and _PANDAS_GREATER_EQUAL_1_4_0):
+        raise ModuleNotFoundError("The `pyarrow` engine requires `pyarrow` and `pandas>=1.4` to be installed.")
     try:
-        return pd.read_csv(file, encoding="utf-8")
+        return pd.read_csv(file, encoding="utf-8", usecols=usecols, engine=engine)
     except UnicodeDecodeError:
         rank_zero_warn("A UnicodeDecodeError was raised when reading the CSV. This error will be ignored.")
         if _PANDAS_GREATER_EQUAL_1_3_0:
-            return pd.read_csv(file, encoding="utf-8", encoding_errors="ignore")
+            return pd.read_csv(file, encoding="utf-8", encoding_errors="ignore", usecols=usecols, engine=engine)
         else:
-            return pd.read_csv(file, encoding=None, engine="python")
+            return pd.read_csv(file, encoding=None, engine=engine or "python", usecols=usecols)
 
 
 def _resolve_multi_target(target_keys: List[str], row: pd.Series) -> List[Any]:
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
 from typing import Any, Callable, cast, List, Optional, Tuple, TypeVar, Union
 
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -22,6 +24,8 @@ PATH_TYPE = Union[str, bytes, os.PathLike]
 
 T = TypeVar("T")
 
+_MAX_SCAN_WORKERS = 8
+
 
 # adapted from torchvision:
 # https://github.com/pytorch/vision/blob/master/torchvision/datasets/folder.py#L10
@@ -76,20 +80,30 @@ def make_dataset(
     is_valid_file = cast(Callable[[str], bool], is_valid_file)
     subdirs = list_subdirs(directory)
     if len(subdirs) > 0:
-        for target_class in subdirs:
-            target_dir = os.path.join(directory, target_class)
-            if not os.path.isdir(target_dir):
-                continue
-            for root, _, fnames in sorted(os.walk(target_dir, followlinks=True)):
-                for fname in sorted(fnames):
-                    path = os.path.join(root, fname)
-                    if is_valid_file(path):
-                        files.append(path)
-                        targets.append(target_class)
+        target_dirs = [os.path.join(directory, target_class) for target_class in subdirs]
+        # Directory traversal is I/O bound, so the class folders are scanned concurrently (in order)
+        with ThreadPoolExecutor(max_workers=min(len(target_dirs), _MAX_SCAN_WORKERS)) as executor:
+            class_files = executor.map(_list_class_files, target_dirs, [is_valid_file] * len(target_dirs))
+            for target_class, target_files in zip(subdirs, class_files):
+                files.extend(target_files)
+                targets.extend([target_class] * len(target_files))
         return files, targets
     return list_valid_files(directory), None
 
 
+def _list_class_files(target_dir: str, is_valid_file: Callable[[str], bool]) -> List[str]:
+    """Recursively list the (sorted) valid files inside a single class folder."""
+    if not os.path.isdir(target_dir):
+        return []
+    files = []
+    for root, _, fnames in sorted(os.walk(target_dir, followlinks=True)):
+        for fname in sorted(fnames):
+            path = os.path.join(root, fname)
+            if is_valid_file(path):
+                files.append(path)
+    return files
+
+
 def isdir(path: Any) -> bool:
     try:
         return os.path.isdir(path)
@@ -161,9 +175,8 @@ def filter_valid_files(
 
     if valid_extensions is None:
         return (files,) + additional_lists
-    filtered = list(
-        filter(lambda sample: has_file_allowed_extension(sample[0], valid_extensions), zip(files, *additional_lists))
-    )
+    # Compute the mask once and apply it to each list rather than zipping and filtering per-sample tuples
+    mask = [has_file_allowed_extension(file, valid_extensions) for file in files]
     if len(additional_lists) > 0:
-        return tuple(zip(*filtered))
-    return [f[0] for f in filtered]
+        return tuple(list(compress(values, mask)) for values in (files,) + additional_lists)
+    return list(compress(files, mask))
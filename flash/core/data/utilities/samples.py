@@ -11,23 +11,59 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, Dict, List, Optional, Sequence, TypeVar, Union
 
 from flash.core.data.io.input import DataKeys
 
 T = TypeVar("T")
 
 
-def to_samples(inputs: List[Any], targets: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
-    """Package a list of inputs and, optionally, a list of targets in a list of dictionaries (samples).
+class _Samples(Sequence):
+    """A sequence of sample dictionaries which stores the inputs and targets as parallel sequences and only
+    creates the sample dictionary for a given index when it is requested.
+
+    Args:
+        inputs: The sequence of inputs.
+        targets: Optionally, the sequence of targets.
+    """
+
+    def __init__(self, inputs: Sequence[Any], targets: Optional[Sequence[Any]] = None):
+        self.inputs = inputs
+        self.targets = targets
+        self._len = len(inputs) if targets is None else min(len(inputs), len(targets))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], "_Samples"]:
+        if isinstance(index, slice):
+            index = range(len(self))[index]
+            inputs = [self.inputs[i] for i in index]
+            return _Samples(inputs, None if self.targets is None else [self.targets[i] for i in index])
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("sample index out of range")
+        if self.targets is None:
+            return {DataKeys.INPUT: self.inputs[index]}
+        return {DataKeys.INPUT: self.inputs[index], DataKeys.TARGET: self.targets[index]}
+
+
+def _as_sequence(x: Any) -> Sequence[Any]:
+    if hasattr(x, "__getitem__") and hasattr(x, "__len__"):
+        return x
+    return list(x)
+
+
+def to_samples(inputs: List[Any], targets: Optional[List[Any]] = None) -> Sequence[Dict[str, Any]]:
+    """Package a list of inputs and, optionally, a list of targets in a sequence of dictionaries (samples). The
+    inputs and targets are not copied, each sample dictionary is created when it is indexed.
 
     Args:
         inputs: The list of inputs to package as dictionaries.
         targets: Optionally provide a list of targets to also be included in the samples.
 
     Returns:
-        A list of sample dictionaries.
+        A sequence of sample dictionaries.
     """
-    if targets is None:
-        return [{DataKeys.INPUT: input} for input in inputs]
-    return [{DataKeys.INPUT: input, DataKeys.TARGET: target} for input, target in zip(inputs, targets)]
+    return _Samples(_as_sequence(inputs), None if targets is None else _as_sequence(targets))
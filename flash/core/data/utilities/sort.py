@@ -14,6 +14,8 @@
 import re
 from typing import Iterable, List, Union
 
+_DIGITS = re.compile("[0-9]")
+
 
 def _convert(text: str) -> Union[int, str]:
     return int(text) if text.isdigit() else text
@@ -30,4 +32,8 @@ def sorted_alphanumeric(iterable: Iterable[str]) -> Iterable[str]:
     Copied from:
     https://blog.codinghorror.com/sorting-for-humans-natural-sort-order/
     """
+    iterable = list(iterable)
+    if not any(_DIGITS.search(key) for key in iterable):
+        # Without any digits the natural order is just the lexicographic order, so we can skip the key function
+        return sorted(iterable)
     return sorted(iterable, key=_alphanumeric_key)
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from dataclasses import dataclass
+from itertools import chain
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Tuple
 
+import numpy as np
 from torch import nn
 
 from flash.core.data.io.input import DataKeys
@@ -37,6 +40,7 @@ if _ICEVISION_AVAILABLE:
     )
     from icevision.data.prediction import Prediction
     from icevision.tfms import A
+    from pycocotools import mask as mask_utils
 
 if _ICEVISION_AVAILABLE and _ICEVISION_GREATER_EQUAL_0_11_0:
     from icevision.core.mask import MaskFile
@@ -45,10 +49,91 @@ elif _ICEVISION_AVAILABLE:
     from icevision.core.record_components import MasksRecordComponent
 
 
+_BBOX_KEYS = ("xmin", "ymin", "width", "height")
+_KEYPOINT_KEYS = ("x", "y", "visible")
+_get_xyv = itemgetter(*_KEYPOINT_KEYS)
+
+
+def _mask_array_to_icevision(mask_array) -> "MaskArray":
+    # ``MaskArray`` always copies its data, so avoid wrapping masks which are already a ``MaskArray``
+    return mask_array if isinstance(mask_array, MaskArray) else MaskArray(mask_array)
+
+
+def _mask_array_from_icevision(mask_array, record: "BaseRecord") -> np.ndarray:
+    if isinstance(mask_array, EncodedRLEs):
+        if len(mask_array) == 0:
+            # pycocotools can't decode an empty list of RLEs, so build the empty ``(0, H, W)`` mask array directly
+            return np.zeros((0, record.height, record.width), dtype=np.uint8)
+        # Decode with pycocotools directly, ``EncodedRLEs.to_mask`` would copy the decoded masks again when
+        # wrapping them in a ``MaskArray``
+        return mask_utils.decode(mask_array.erles).transpose(2, 0, 1)
+    if isinstance(mask_array, MaskArray):
+        return mask_array.data
+    raise RuntimeError("Mask arrays are expected to be a MaskArray or EncodedRLEs.")
+
+
+def _to_icevision_mask_component_0_11(target: Dict[str, Any]):
+    mask_array = target.get("mask_array", None)
+    masks = target.get("masks", None)
+
+    if mask_array is None and masks is None:
+        return None
+
+    component = InstanceMasksRecordComponent()
+    if masks is not None:
+        component.set_masks([MaskFile(mask) for mask in masks])
+    if mask_array is not None:
+        component.set_mask_array(_mask_array_to_icevision(mask_array))
+    return component
+
+
+def _to_icevision_mask_component_legacy(target: Dict[str, Any]):
+    mask_array = target.get("mask_array", None)
+
+    if mask_array is None:
+        return None
+
+    component = MasksRecordComponent()
+    component.set_masks(mask_array)
+    return component
+
+
+def _from_icevision_masks_0_11(record: "BaseRecord", result: Dict[str, Any]):
+    detection = record.detection
+    mask_array = getattr(detection, "mask_array", None)
+    if mask_array is not None:
+        result["mask_array"] = _mask_array_from_icevision(mask_array, record)
+
+    masks = getattr(detection, "masks", None)
+    if masks is not None:
+        if not all(isinstance(mask, MaskFile) for mask in masks):
+            raise RuntimeError("Masks are expected to be MaskFile objects.")
+        result["masks"] = [mask.filepath for mask in masks]
+
+
+def _from_icevision_masks_legacy(record: "BaseRecord", result: Dict[str, Any]):
+    mask_array = getattr(record.detection, "masks", None)
+    if mask_array is not None:
+        result["mask_array"] = _mask_array_from_icevision(mask_array, record)
+
+
+# The IceVision version is fixed for the lifetime of the process, so the mask conversions are selected once here
+if _ICEVISION_GREATER_EQUAL_0_11_0:
+    _to_icevision_mask_component = _to_icevision_mask_component_0_11
+    _from_icevision_masks = _from_icevision_masks_0_11
+else:
+    _to_icevision_mask_component = _to_icevision_mask_component_legacy
+    _from_icevision_masks = _from_icevision_masks_legacy
+
+
 def to_icevision_record(sample: Dict[str, Any]):
-    record = BaseRecord([])
+    # Components are collected and registered together when the record is created, each call to
+    # ``BaseRecord.add_component`` rebuilds all of the record's task composites
+    components = []
 
     metadata = sample.get(DataKeys.METADATA, None) or {}
+    target = sample[DataKeys.TARGET]
+    input_ = sample[DataKeys.INPUT]
 
     if "image_id" in metadata:
         record_id_component = RecordIDRecordComponent()
@@ -56,72 +141,50 @@ def to_icevision_record(sample: Dict[str, Any]):
 
     component = ClassMapRecordComponent(tasks.detection)
     component.set_class_map(metadata.get("class_map", None))
-    record.add_component(component)
+    components.append(component)
 
-    if "labels" in sample[DataKeys.TARGET]:
+    if "labels" in target:
         labels_component = InstancesLabelsRecordComponent()
-        labels_component.add_labels_by_id(sample[DataKeys.TARGET]["labels"])
-        record.add_component(labels_component)
+        labels_component.add_labels_by_id(target["labels"])
+        components.append(labels_component)
 
-    if "bboxes" in sample[DataKeys.TARGET]:
+    if "bboxes" in target:
         bboxes = [
-            BBox.from_xywh(bbox["xmin"], bbox["ymin"], bbox["width"], bbox["height"])
-            for bbox in sample[DataKeys.TARGET]["bboxes"]
+            BBox.from_xywh(bbox["xmin"], bbox["ymin"], bbox["width"], bbox["height"]) for bbox in target["bboxes"]
         ]
         component = BBoxesRecordComponent()
         component.set_bboxes(bboxes)
-        record.add_component(component)
-
-    if _ICEVISION_GREATER_EQUAL_0_11_0:
-        mask_array = sample[DataKeys.TARGET].get("mask_array", None)
-        masks = sample[DataKeys.TARGET].get("masks", None)
-
-        if mask_array is not None or masks is not None:
-            component = InstanceMasksRecordComponent()
+        components.append(component)
 
-            if masks is not None:
-                masks = [MaskFile(mask) for mask in masks]
-                component.set_masks(masks)
+    mask_component = _to_icevision_mask_component(target)
+    if mask_component is not None:
+        components.append(mask_component)
 
-            if mask_array is not None:
-                mask_array = MaskArray(mask_array)
-                component.set_mask_array(mask_array)
-
-            record.add_component(component)
-    else:
-        mask_array = sample[DataKeys.TARGET].get("mask_array", None)
-        if mask_array is not None:
-            component = MasksRecordComponent()
-            component.set_masks(mask_array)
-            record.add_component(component)
-
-    if "keypoints" in sample[DataKeys.TARGET]:
+    if "keypoints" in target:
         keypoints = []
 
-        for keypoints_list, keypoints_metadata in zip(
-            sample[DataKeys.TARGET]["keypoints"], sample[DataKeys.TARGET]["keypoints_metadata"]
-        ):
-            xyv = []
-            for keypoint in keypoints_list:
-                xyv.extend((keypoint["x"], keypoint["y"], keypoint["visible"]))
-
+        for keypoints_list, keypoints_metadata in zip(target["keypoints"], target["keypoints_metadata"]):
+            xyv = list(chain.from_iterable(map(_get_xyv, keypoints_list)))
             keypoints.append(KeyPoints.from_xyv(xyv, keypoints_metadata))
         component = KeyPointsRecordComponent()
         component.set_keypoints(keypoints)
-        record.add_component(component)
+        components.append(component)
+
+    if isinstance(input_, str):
+        input_component = FilepathRecordComponent()
+        input_component.set_filepath(input_)
+        components.append(input_component)
+        return BaseRecord(components)
 
-    if isinstance(sample[DataKeys.INPUT], str):
+    if "filepath" in metadata:
         input_component = FilepathRecordComponent()
-        input_component.set_filepath(sample[DataKeys.INPUT])
+        input_component.filepath = metadata["filepath"]
     else:
-        if "filepath" in metadata:
-            input_component = FilepathRecordComponent()
-            input_component.filepath = metadata["filepath"]
-        else:
-            input_component = ImageRecordComponent()
-        input_component.composite = record
-        input_component.set_img(sample[DataKeys.INPUT])
-    record.add_component(input_component)
+        input_component = ImageRecordComponent()
+    components.append(input_component)
+    record = BaseRecord(components)
+    # The image size is stored on the record, so the image can only be set once the component has been added
+    input_component.set_img(input_)
 
     return record
 
@@ -132,57 +195,16 @@ def from_icevision_detection(record: "BaseRecord"):
     result = {}
 
     if hasattr(detection, "bboxes"):
-        result["bboxes"] = [
-            {
-                "xmin": bbox.xmin,
-                "ymin": bbox.ymin,
-                "width": bbox.width,
-                "height": bbox.height,
-            }
-            for bbox in detection.bboxes
-        ]
-
-    mask_array = (
-        getattr(detection, "mask_array", None) if _ICEVISION_GREATER_EQUAL_0_11_0 else getattr(detection, "masks", None)
-    )
-    if mask_array is not None:
-        if isinstance(mask_array, EncodedRLEs):
-            mask_array = mask_array.to_mask(record.height, record.width)
+        result["bboxes"] = [dict(zip(_BBOX_KEYS, bbox.xywh)) for bbox in detection.bboxes]
 
-        if isinstance(mask_array, MaskArray):
-            result["mask_array"] = mask_array.data
-        else:
-            raise RuntimeError("Mask arrays are expected to be a MaskArray or EncodedRLEs.")
-
-    masks = getattr(detection, "masks", None)
-    if masks is not None and _ICEVISION_GREATER_EQUAL_0_11_0:
-        result["masks"] = []
-        for mask in masks:
-            if isinstance(mask, MaskFile):
-                result["masks"].append(mask.filepath)
-            else:
-                raise RuntimeError("Masks are expected to be MaskFile objects.")
+    _from_icevision_masks(record, result)
 
     if hasattr(detection, "keypoints"):
         keypoints = detection.keypoints
 
-        result["keypoints"] = []
-        result["keypoints_metadata"] = []
-
-        for keypoint in keypoints:
-            keypoints_list = []
-            for x, y, v in keypoint.xyv:
-                keypoints_list.append(
-                    {
-                        "x": x,
-                        "y": y,
-                        "visible": v,
-                    }
-                )
-            result["keypoints"].append(keypoints_list)
-
-            # TODO: Unpack keypoints_metadata
-            result["keypoints_metadata"].append(keypoint.metadata)
+        result["keypoints"] = [[dict(zip(_KEYPOINT_KEYS, point)) for point in keypoint.xyv] for keypoint in keypoints]
+        # TODO: Unpack keypoints_metadata
+        result["keypoints_metadata"] = [keypoint.metadata for keypoint in keypoints]
 
     if getattr(detection, "label_ids", None) is not None:
         result["labels"] = list(detection.label_ids)
@@ -194,39 +216,34 @@ def from_icevision_detection(record: "BaseRecord"):
 
 
 def from_icevision_record(record: "BaseRecord"):
-    sample = {
-        DataKeys.METADATA: {
-            "size": (record.height, record.width),
-        }
-    }
+    metadata = {"size": (record.height, record.width)}
+    sample = {DataKeys.METADATA: metadata}
 
-    if getattr(record, "record_id", None) is not None:
-        sample[DataKeys.METADATA]["image_id"] = record.record_id
+    record_id = getattr(record, "record_id", None)
+    if record_id is not None:
+        metadata["image_id"] = record_id
 
-    if getattr(record, "filepath", None) is not None:
-        sample[DataKeys.METADATA]["filepath"] = record.filepath
+    filepath = getattr(record, "filepath", None)
+    if filepath is not None:
+        metadata["filepath"] = filepath
 
-    if record.img is not None:
-        sample[DataKeys.INPUT] = record.img
-        filepath = getattr(record, "filepath", None)
-        if filepath is not None:
-            sample[DataKeys.METADATA]["filepath"] = filepath
-    elif record.filepath is not None:
-        sample[DataKeys.INPUT] = record.filepath
+    img = record.img
+    if img is not None:
+        sample[DataKeys.INPUT] = img
+    elif filepath is not None:
+        sample[DataKeys.INPUT] = filepath
 
     sample[DataKeys.TARGET] = from_icevision_detection(record)
 
-    if getattr(record.detection, "class_map", None) is not None:
-        sample[DataKeys.METADATA]["class_map"] = record.detection.class_map
+    class_map = getattr(record.detection, "class_map", None)
+    if class_map is not None:
+        metadata["class_map"] = class_map
 
     return sample
 
 
 def from_icevision_predictions(predictions: List["Prediction"]):
-    result = []
-    for prediction in predictions:
-        result.append(from_icevision_detection(prediction.pred))
-    return result
+    return [from_icevision_detection(prediction.pred) for prediction in predictions]
 
 
 class IceVisionTransformAdapter(nn.Module):
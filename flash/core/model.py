@@ -1072,13 +1072,13 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
             return [BenchmarkConvergenceCI()]
 
     @requires("serve")
-    def run_serve_sanity_check(self, serve_input: ServeInput):
+    def run_serve_sanity_check(self, serve_input: ServeInput, torch_compile: bool = False, quantize: bool = False):
         from fastapi.testclient import TestClient
 
         from flash.core.serve.flash_components import build_flash_serve_model_component
 
         print("Running serve sanity check")
-        comp = build_flash_serve_model_component(self, serve_input)
+        comp = build_flash_serve_model_component(self, serve_input, torch_compile=torch_compile, quantize=quantize)
         composition = Composition(predict=comp, TESTING=True, DEBUG=True)
         app = composition.serve(host="0.0.0.0", port=8000)
 
@@ -1097,6 +1097,8 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
         input_cls: Optional[Type[ServeInput]] = None,
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
+        torch_compile: bool = False,
+        quantize: bool = False,
     ) -> "Composition":
         """Serve the ``Task``. Override this method to provide a default ``input_cls``, ``transform``, and
         ``transform_kwargs``.
@@ -1108,6 +1110,10 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
             input_cls: The ``ServeInput`` type to use.
             transform: The transform to use when serving.
             transform_kwargs: Keyword arguments used to instantiate the transform.
+            torch_compile: If ``True``, the served ``predict_step`` is compiled with ``torch.compile`` (requires
+                ``torch>=2.0``).
+            quantize: If ``True``, a copy of the model with its ``Linear`` layers dynamically quantized to ``int8`` is
+                served (CPU only).
         """
         from flash.core.serve.flash_components import build_flash_serve_model_component
 
@@ -1117,9 +1123,9 @@ class Task(DatasetProcessor, ModuleWrapperBase, LightningModule, FineTuningHooks
         serve_input = input_cls(transform=transform, transform_kwargs=transform_kwargs)
 
         if sanity_check:
-            self.run_serve_sanity_check(serve_input)
+            self.run_serve_sanity_check(serve_input, torch_compile=torch_compile, quantize=quantize)
 
-        comp = build_flash_serve_model_component(self, serve_input)
+        comp = build_flash_serve_model_component(self, serve_input, torch_compile=torch_compile, quantize=quantize)
         composition = Composition(predict=comp, TESTING=flash._IS_TESTING)
         composition.serve(host=host, port=port)
         return composition
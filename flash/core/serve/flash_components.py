@@ -2,12 +2,14 @@ import inspect
 from typing import Any, Callable, Mapping
 
 import torch
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 from flash.core.data.batch import _ServeInputProcessor
 from flash.core.data.data_pipeline import DataPipelineState
 from flash.core.data.io.input import DataKeys
 from flash.core.serve import expose, ModelComponent
 from flash.core.serve.types.base import BaseType
+from flash.core.utilities.imports import _TORCH_GREATER_EQUAL_2_0
 from flash.core.utilities.stages import RunningStage
 
 
@@ -33,13 +35,12 @@ class FlashOutputs(BaseType):
         self._output = output
 
     def serialize(self, outputs) -> Any:  # pragma: no cover
-        results = []
-        if isinstance(outputs, (list, torch.Tensor)):
-            for output in outputs:
-                result = self._output(output)
-                if isinstance(result, Mapping):
-                    result = result[DataKeys.PREDS]
-                results.append(result)
+        if not isinstance(outputs, (list, tuple, torch.Tensor)):
+            outputs = [outputs]
+        results = [self._output(output) for output in outputs]
+        # All outputs are produced by the same ``Output``, so only the first result needs to be checked
+        if results and isinstance(results[0], Mapping):
+            results = [result[DataKeys.PREDS] for result in results]
         if len(results) == 1:
             return results[0]
         return results
@@ -48,7 +49,19 @@ class FlashOutputs(BaseType):
         return None
 
 
-def build_flash_serve_model_component(model, serve_input):
+def build_flash_serve_model_component(model, serve_input, torch_compile: bool = False, quantize: bool = False):
+    """Build the ``ModelComponent`` used to serve the given ``model``.
+
+    Args:
+        model: The ``Task`` to serve.
+        serve_input: The ``ServeInput`` used to deserialize requests.
+        torch_compile: If ``True``, the model's ``predict_step`` is wrapped with ``torch.compile`` (requires
+            ``torch>=2.0``). The first requests will be slower while the graph is compiled.
+        quantize: If ``True``, a copy of the model with its ``Linear`` layers dynamically quantized to ``int8`` is
+            served. Dynamic quantization is only supported for models served on CPU.
+    """
+    if torch_compile and not _TORCH_GREATER_EQUAL_2_0:
+        raise MisconfigurationException("Compiling the served model requires `torch>=2.0`.")
 
     data_pipeline_state = DataPipelineState()
     for properties in [
@@ -67,7 +80,12 @@ def build_flash_serve_model_component(model, serve_input):
         def __init__(self, model):
             self.model = model
             self.model.eval()
-            self.data_pipeline = model.build_data_pipeline()
+            if quantize:
+                self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.predict_step = self.model.predict_step
+            if torch_compile:
+                self.predict_step = torch.compile(self.predict_step, mode="max-autotune")
+            self.data_pipeline = data_pipeline
             self.serve_input = serve_input
             self.dataloader_collate_fn = self.serve_input._create_dataloader_collate_fn([])
             self.on_after_batch_transfer_fn = self.serve_input._create_on_after_batch_transfer_fn([])
@@ -89,7 +107,7 @@ def build_flash_serve_model_component(model, serve_input):
                 else:
                     inputs = self.model.transfer_batch_to_device(inputs, self.device)
                 inputs = self.on_after_batch_transfer_fn(inputs)
-                preds = self.model.predict_step(inputs, 0)
+                preds = self.predict_step(inputs, 0)
                 preds = self.output_transform_processor(preds)
                 return preds
 
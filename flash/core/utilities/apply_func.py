@@ -15,16 +15,21 @@ from typing import Callable, Dict, Mapping, Sequence, Type, Union
 
 
 def get_callable_name(fn_or_class: Union[Callable, object]) -> str:
-    return getattr(fn_or_class, "__name__", fn_or_class.__class__.__name__).lower()
+    name = getattr(fn_or_class, "__name__", None)
+    if name is None:
+        name = type(fn_or_class).__name__
+    return name if name.islower() else name.lower()
 
 
 def get_callable_dict(fn: Union[Callable, Mapping, Sequence]) -> Union[Dict, Mapping]:
-    if isinstance(fn, Mapping):
+    # The concrete built-in types are checked before the (slower) ABC instance checks
+    if isinstance(fn, (dict, Mapping)):
         return fn
-    if isinstance(fn, Sequence):
+    if isinstance(fn, (list, tuple, Sequence)):
         return {get_callable_name(f): f for f in fn}
     if callable(fn):
         return {get_callable_name(fn): fn}
+    raise TypeError(f"Expected a callable, a mapping or a sequence of callables, got {type(fn).__name__}.")
 
 
 def _is_overridden(method_name: str, instance: object, parent: Type[object]) -> bool:
@@ -69,6 +69,7 @@ _TORCH_AVAILABLE = _module_available("torch")
 _PL_AVAILABLE = _module_available("pytorch_lightning")
 _BOLTS_AVAILABLE = _module_available("pl_bolts") and _compare_version("torch", operator.lt, "1.9.0")
 _PANDAS_AVAILABLE = _module_available("pandas")
+_PYARROW_AVAILABLE = _module_available("pyarrow")
 _SKLEARN_AVAILABLE = _module_available("sklearn")
 _TABNET_AVAILABLE = _module_available("pytorch_tabnet")
 _FORECASTING_AVAILABLE = _module_available("pytorch_forecasting")
@@ -119,11 +120,14 @@ else:
 
 
 if Version:
+    _TORCH_GREATER_EQUAL_2_0 = _compare_version("torch", operator.ge, "2.0.0")
     _TORCHVISION_GREATER_EQUAL_0_9 = _compare_version("torchvision", operator.ge, "0.9.0")
     _PL_GREATER_EQUAL_1_4_3 = _compare_version("pytorch_lightning", operator.ge, "1.4.3")
     _PL_GREATER_EQUAL_1_5_0 = _compare_version("pytorch_lightning", operator.ge, "1.5.0")
     _PANDAS_GREATER_EQUAL_1_3_0 = _compare_version("pandas", operator.ge, "1.3.0")
+    _PANDAS_GREATER_EQUAL_1_4_0 = _compare_version("pandas", operator.ge, "1.4.0")
     _ICEVISION_GREATER_EQUAL_0_11_0 = _compare_version("icevision", operator.ge, "0.11.0")
+    _FIFTYONE_GREATER_EQUAL_0_16_0 = _compare_version("fiftyone", operator.ge, "0.16.0")
 
 _TEXT_AVAILABLE = all(
     [
@@ -40,13 +40,13 @@ class RunningStage(LightningEnum):
 
     @property
     def evaluating(self) -> bool:
-        return self in (self.VALIDATING, self.TESTING)
+        return self is RunningStage.VALIDATING or self is RunningStage.TESTING
 
     @property
     def dataloader_prefix(self) -> Optional[str]:
-        if self in (self.SANITY_CHECKING, self.TUNING):
+        if self is RunningStage.SANITY_CHECKING or self is RunningStage.TUNING:
             return None
-        if self == self.VALIDATING:
+        if self is RunningStage.VALIDATING:
             return "val"
         return self.value
 
@@ -11,7 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Type, Union
+from collections import deque
+from typing import Any, Callable, Collection, Deque, Dict, List, Optional, Sequence, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -217,7 +218,7 @@ class ImageClassificationData(DataModule):
         train_data = (train_data_frame, input_field, target_fields, train_images_root, train_resolver)
         val_data = (val_data_frame, input_field, target_fields, val_images_root, val_resolver)
         test_data = (test_data_frame, input_field, target_fields, test_images_root, test_resolver)
-        predict_data = (predict_data_frame, input_field, predict_images_root, predict_resolver)
+        predict_data = (predict_data_frame, input_field, None, predict_images_root, predict_resolver)
 
         return cls(
             input_cls(RunningStage.TRAINING, *train_data, transform=train_transform, **ds_kw),
@@ -250,6 +251,7 @@ class ImageClassificationData(DataModule):
         predict_transform: INPUT_TRANSFORM_TYPE = ImageClassificationInputTransform,
         input_cls: Type[Input] = ImageClassificationCSVInput,
         transform_kwargs: Optional[Dict] = None,
+        csv_engine: Optional[str] = None,
         **data_module_kwargs: Any,
     ) -> "ImageClassificationData":
 
@@ -259,10 +261,16 @@ class ImageClassificationData(DataModule):
             input_transforms_registry=cls.input_transforms_registry,
         )
 
+        if issubclass(input_cls, ImageClassificationCSVInput):
+            # Share the parsed files between the inputs, so that a file used for several stages is only parsed once
+            ds_kw["data_frames"] = {}
+            if csv_engine is not None:
+                ds_kw["engine"] = csv_engine
+
         train_data = (train_file, input_field, target_fields, train_images_root, train_resolver)
         val_data = (val_file, input_field, target_fields, val_images_root, val_resolver)
         test_data = (test_file, input_field, target_fields, test_images_root, test_resolver)
-        predict_data = (predict_file, input_field, predict_images_root, predict_resolver)
+        predict_data = (predict_file, input_field, None, predict_images_root, predict_resolver)
 
         return cls(
             input_cls(RunningStage.TRAINING, *train_data, transform=train_transform, **ds_kw),
@@ -480,6 +488,11 @@ class MatplotlibVisualization(BaseVisualization):
 
     max_cols: int = 4  # maximum number of columns we accept
     block_viz_window: bool = True  # parameter to allow user to block visualisation windows
+    max_open_figures: int = 4  # maximum number of non-blocking figures kept open at once
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._open_figures: Deque = deque()
 
     @staticmethod
     @requires("image")
@@ -490,7 +503,8 @@ class MatplotlibVisualization(BaseVisualization):
         elif isinstance(img, Image.Image):
             out = np.array(img)
         elif isinstance(img, torch.Tensor):
-            out = img.squeeze(0).permute(1, 2, 0).cpu().numpy()
+            # Copy to the host before permuting so the permuted layout is never materialized on the device
+            out = img.squeeze(0).cpu().permute(1, 2, 0).numpy()
         else:
             raise TypeError(f"Unknown image type. Got: {type(img)}.")
         return out
@@ -499,23 +513,34 @@ class MatplotlibVisualization(BaseVisualization):
     def _show_images_and_labels(self, data: List[Any], num_samples: int, title: str):
         # define the image grid
         cols: int = min(num_samples, self.max_cols)
-        rows: int = num_samples // cols
+        rows: int = -(-num_samples // cols)
 
         # create figure and set title
-        fig, axs = plt.subplots(rows, cols)
+        fig, axs = plt.subplots(rows, cols, squeeze=False)
         fig.suptitle(title)
 
-        if not isinstance(axs, np.ndarray):
-            axs = [axs]
-
-        for i, ax in enumerate(axs):
-            # unpack images and labels
-            if isinstance(data, list):
-                _img, _label = data[i][DataKeys.INPUT], data[i].get(DataKeys.TARGET, "")
-            elif isinstance(data, dict):
-                _img, _label = data[DataKeys.INPUT][i], data.get(DataKeys.TARGET, [""] * (i + 1))[i]
-            else:
-                raise TypeError(f"Unknown data type. Got: {type(data)}.")
+        # unpack images and labels
+        if isinstance(data, list):
+            images = [sample[DataKeys.INPUT] for sample in data]
+            labels = [sample.get(DataKeys.TARGET, "") for sample in data]
+        elif isinstance(data, dict):
+            images = data[DataKeys.INPUT]
+            if isinstance(images, torch.Tensor) and images.ndim == 4:
+                # convert the whole batch of images to numpy at once
+                images = images.cpu().permute(0, 2, 3, 1).numpy()
+            labels = data.get(DataKeys.TARGET, [""] * num_samples)
+            if isinstance(labels, torch.Tensor):
+                # move all of the labels to the host with a single copy
+                labels = labels.cpu()
+        else:
+            raise TypeError(f"Unknown data type. Got: {type(data)}.")
+
+        for i, ax in enumerate(axs.flat):
+            if i >= num_samples:
+                # hide the unused cells of the last row
+                ax.axis("off")
+                continue
+            _img, _label = images[i], labels[i]
             # convert images to numpy
             _img: np.ndarray = self._to_numpy(_img)
             if isinstance(_label, torch.Tensor):
@@ -524,7 +549,17 @@ class MatplotlibVisualization(BaseVisualization):
             ax.imshow(_img)
             ax.set_title(str(_label))
             ax.axis("off")
-        plt.show(block=self.block_viz_window)
+
+        if self.block_viz_window:
+            plt.show(block=True)
+            return
+
+        # close the oldest figures so that non-blocking previews don't accumulate
+        self._open_figures.append(fig)
+        while len(self._open_figures) > self.max_open_figures:
+            plt.close(self._open_figures.popleft())
+        plt.show(block=False)
+        plt.pause(0.001)  # give the GUI event loop a chance to draw the figure
 
     def show_load_sample(self, samples: List[Any], running_stage: RunningStage):
         win_title: str = f"{running_stage} - show_load_sample"
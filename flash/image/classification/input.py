@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -126,6 +126,22 @@ class ImageClassificationDataFrameInput(ImageClassificationFilesInput):
 
 
 class ImageClassificationCSVInput(ImageClassificationDataFrameInput):
+    def __init__(
+        self,
+        *args,
+        engine: Optional[str] = None,
+        data_frames: Optional[Dict[Tuple[str, Tuple[str, ...]], pd.DataFrame]] = None,
+        **kwargs,
+    ):
+        # The ``pd.read_csv`` parser engine, see ``flash.core.data.utilities.data_frame.read_csv``
+        self._engine = engine
+        # ``data_frames`` can be shared by the inputs created together (e.g. in ``from_csv``), so that a file used for
+        # several stages is only parsed once. The data frames are not modified when loading the data.
+        self._data_frames = {} if data_frames is None else data_frames
+        super().__init__(*args, **kwargs)
+        # The parsed files are only needed while loading the data
+        self._data_frames = {}
+
     def load_data(
         self,
         csv_file: PATH_TYPE,
@@ -134,7 +150,21 @@ class ImageClassificationCSVInput(ImageClassificationDataFrameInput):
         root: Optional[PATH_TYPE] = None,
         resolver: Optional[Callable[[Optional[PATH_TYPE], Any], PATH_TYPE]] = None,
     ) -> List[Dict[str, Any]]:
-        data_frame = read_csv(csv_file)
+        """Load the files and targets from the given columns of a CSV file.
+
+        Only the ``input_key`` and ``target_keys`` columns are parsed from the file, so if any of them is missing then
+        ``pd.read_csv`` raises a ``ValueError`` (``Usecols do not match columns``) instead of the ``KeyError`` that
+        would be raised when reading the columns from a fully parsed data frame.
+        """
+        # Only the input and target columns are used, so there is no need to parse the rest of the file
+        usecols = [input_key]
+        if target_keys is not None:
+            usecols.extend(target_keys if isinstance(target_keys, List) else [target_keys])
+
+        key = (os.path.abspath(csv_file), tuple(usecols))
+        if key not in self._data_frames:
+            self._data_frames[key] = read_csv(csv_file, usecols=usecols, engine=self._engine)
+        data_frame = self._data_frames[key]
         if root is None:
             root = os.path.dirname(csv_file)
         return super().load_data(data_frame, input_key, target_keys, root, resolver)
@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import warnings
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import torch
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from torch.utils.data import DataLoader, Dataset, random_split
+from torch.utils.data import DataLoader, Dataset, random_split, Subset
 
 from flash.core.data.data_module import DataModule
 from flash.core.data.data_pipeline import DataPipeline
@@ -44,6 +44,49 @@ def filter_unlabelled_data(dataset: InputBase) -> Dataset:
     return dataset
 
 
+def _xlogx(x: torch.Tensor) -> torch.Tensor:
+    # ``0 * log(0)`` is taken to be ``0``
+    return x * torch.log(x.clamp_min(torch.finfo(x.dtype).tiny))
+
+
+def _to_probabilities(x: torch.Tensor) -> torch.Tensor:
+    """Convert logits to probabilities along the class dimension, as ``baal`` does for its heuristics.
+
+    ``x`` is returned unchanged if it is bounded by ``[0, 1]`` and (for multiple classes) sums to one.
+    """
+    multiclass = x.shape[1] > 1
+    if x.min() >= 0 and x.max() <= 1:
+        if not multiclass:
+            return x
+        total = x.sum(1)
+        if torch.allclose(total, torch.ones_like(total)):
+            return x
+    return x.softmax(1) if multiclass else x.sigmoid()
+
+
+def _bald_uncertainties(predictions: torch.Tensor) -> np.ndarray:
+    """Compute the BALD score of ``predictions`` with shape ``(num_samples, num_classes, num_iterations)`` on
+    their device, so that only the final scores are copied to the host.
+
+    The predictions should be probabilities, but logits are converted with a softmax (or a sigmoid for a single
+    class) like ``baal.active.heuristics.BALD`` does. The scores are computed in double precision.
+    """
+    probabilities = _to_probabilities(predictions.double())
+    entropy_of_mean = -_xlogx(probabilities.mean(-1)).sum(1)
+    mean_of_entropy = -_xlogx(probabilities).sum(1).mean(-1)
+    return (entropy_of_mean - mean_of_entropy).cpu().numpy()
+
+
+def _scores_like_bald(heuristic: "AbstractHeuristic") -> bool:
+    """Whether ``heuristic`` is a ``BALD`` heuristic (or subclass) which doesn't change how the scores are
+    computed."""
+    heuristic_cls = type(heuristic)
+    return isinstance(heuristic, BALD) and all(
+        getattr(heuristic_cls, name, None) is getattr(BALD, name, None)
+        for name in ("compute_score", "get_uncertainties")
+    )
+
+
 def train_val_split(dataset: Dataset, val_size: float = 0.1):
     L = len(dataset)
     train_size = int(L * (1 - val_size))
@@ -84,6 +127,7 @@ class ActiveLearningDataModule(DataModule):
         self.query_size = query_size
         self.val_split = val_split
         self._dataset: Optional[ActiveLearningDataset] = None
+        self._split_cache: Optional[Tuple[Tuple[int, float], Tuple[Subset, Subset]]] = None
 
         if not self.labelled:
             raise MisconfigurationException("The labelled `datamodule` should be provided.")
@@ -136,9 +180,16 @@ class ActiveLearningDataModule(DataModule):
     def data_pipeline(self) -> "DataPipeline":
         return self.labelled.data_pipeline
 
+    def _train_val_split(self) -> Tuple[Subset, Subset]:
+        # The split is seeded, so it only changes when the labelled set or ``val_split`` does
+        key = (len(self._dataset), self.val_split)
+        if self._split_cache is None or self._split_cache[0] != key:
+            self._split_cache = (key, tuple(train_val_split(self._dataset, self.val_split)))
+        return self._split_cache[1]
+
     def train_dataloader(self) -> "DataLoader":
         if self.val_split:
-            self.labelled._train_input = train_val_split(self._dataset, self.val_split)[0]
+            self.labelled._train_input = self._train_val_split()[0]
         else:
             self.labelled._train_input = self._dataset
 
@@ -148,7 +199,7 @@ class ActiveLearningDataModule(DataModule):
         return self.labelled.train_dataloader()
 
     def _val_dataloader(self) -> "DataLoader":
-        self.labelled._val_input = train_val_split(self._dataset, self.val_split)[1]
+        self.labelled._val_input = self._train_val_split()[1]
         self.labelled._val_dataloader_collate_fn = self.labelled._train_dataloader_collate_fn
         self.labelled._val_on_after_batch_transfer_fn = self.labelled._train_on_after_batch_transfer_fn
         return self.labelled._val_dataloader()
@@ -168,14 +219,27 @@ class ActiveLearningDataModule(DataModule):
                 "The `probabilities` and `indices` are mutually exclusive, pass only of one them."
             )
         if probabilities is not None:
-            probabilities = torch.cat([p[0].unsqueeze(0) for p in probabilities], dim=0)
-            uncertainties = self.heuristic.get_uncertainties(probabilities)
-            indices = np.argsort(uncertainties)
+            probabilities = torch.stack([p[0] for p in probabilities])
+            if _scores_like_bald(self.heuristic) and probabilities.is_cuda and probabilities.dim() == 3:
+                uncertainties = self.heuristic.reduction(_bald_uncertainties(probabilities))
+            else:
+                uncertainties = self.heuristic.get_uncertainties(probabilities)
+            indices = self._top_k(uncertainties, self.query_size)
             if self._dataset is not None:
-                self._dataset.label(indices[-self.query_size :])
+                self._dataset.label(indices)
+                self._split_cache = None
+
+    @staticmethod
+    def _top_k(uncertainties: np.ndarray, k: int) -> np.ndarray:
+        """Return the indices of the ``k`` largest uncertainties in ascending order of uncertainty."""
+        if k >= len(uncertainties):
+            return np.argsort(uncertainties)
+        top = np.argpartition(uncertainties, -k)[-k:]
+        return top[np.argsort(uncertainties[top])]
 
     def state_dict(self) -> Dict[str, torch.Tensor]:
         return self._dataset.state_dict()
 
     def load_state_dict(self, state_dict) -> None:
+        self._split_cache = None
         return self._dataset.load_state_dict(state_dict)
@@ -13,10 +13,18 @@
 # limitations under the License.
 from typing import Any, Dict, Hashable, Sequence, TYPE_CHECKING
 
+import numpy as np
+
 from flash.core.data.io.input import DataKeys
 from flash.core.integrations.fiftyone.utils import FiftyOneLabelUtilities
 from flash.core.integrations.icevision.data import IceVisionInput
-from flash.core.utilities.imports import _FIFTYONE_AVAILABLE, _ICEVISION_AVAILABLE, lazy_import, requires
+from flash.core.utilities.imports import (
+    _FIFTYONE_AVAILABLE,
+    _FIFTYONE_GREATER_EQUAL_0_16_0,
+    _ICEVISION_AVAILABLE,
+    lazy_import,
+    requires,
+)
 
 SampleCollection = None
 if _FIFTYONE_AVAILABLE:
@@ -41,29 +49,44 @@ class FiftyOneParser(Parser):
         template_record.add_component(IsCrowdsRecordComponent())
         super().__init__(template_record=template_record)
 
-        data = data
-        label_field = label_field
-        iscrowd = iscrowd
-
-        self.data = []
         self.class_map = class_map
 
-        for fp, w, h, sample_labs, sample_boxes, sample_iscrowd in zip(
-            data.values("filepath"),
-            data.values("metadata.width"),
-            data.values("metadata.height"),
-            data.values(label_field + ".detections.label"),
-            data.values(label_field + ".detections.bounding_box"),
-            data.values(label_field + ".detections." + iscrowd),
-        ):
-            for lab, box, iscrowd in zip(sample_labs, sample_boxes, sample_iscrowd):
-                self.data.append((fp, w, h, lab, box, iscrowd))
+        fields = [
+            "filepath",
+            "metadata.width",
+            "metadata.height",
+            label_field + ".detections.label",
+            label_field + ".detections.bounding_box",
+            label_field + ".detections." + iscrowd,
+        ]
+        if _FIFTYONE_GREATER_EQUAL_0_16_0:
+            # Fetch all of the fields with a single aggregation
+            values = data.values(fields)
+        else:
+            values = [data.values(field) for field in fields]
+
+        # The detections are stored column-wise, with one entry per detection in each column
+        self.filepaths, self.widths, self.heights, self.labels, self.iscrowds = [], [], [], [], []
+        boxes = []
+        for fp, w, h, sample_labs, sample_boxes, sample_iscrowd in zip(*values):
+            num_detections = len(sample_labs)
+            self.filepaths.extend([fp] * num_detections)
+            self.widths.extend([w] * num_detections)
+            self.heights.extend([h] * num_detections)
+            self.labels.extend(sample_labs)
+            self.iscrowds.extend(sample_iscrowd)
+            boxes.extend(sample_boxes)
+
+        self.boxes = self._reformat_bboxes(
+            np.array(boxes, dtype=float).reshape(-1, 4),
+            np.array([self.widths, self.heights], dtype=float).T.reshape(-1, 2),
+        )
 
     def __iter__(self) -> Any:
-        return iter(self.data)
+        return zip(self.filepaths, self.widths, self.heights, self.labels, self.boxes.tolist(), self.iscrowds)
 
     def __len__(self) -> int:
-        return len(self.data)
+        return len(self.filepaths)
 
     def record_id(self, o) -> Hashable:
         return o[0]
@@ -79,22 +102,17 @@ class FiftyOneParser(Parser):
             record.set_img_size(ImgSize(width=w, height=h))
             record.detection.set_class_map(self.class_map)
 
-        box = self._reformat_bbox(*box, w, h)
-
         record.detection.add_bboxes([BBox.from_xyxy(*box)])
         record.detection.add_labels([lab])
         record.detection.add_iscrowds([iscrowd])
 
     @staticmethod
-    def _reformat_bbox(xmin, ymin, box_w, box_h, img_w, img_h):
-        xmin *= img_w
-        ymin *= img_h
-        box_w *= img_w
-        box_h *= img_h
-        xmax = xmin + box_w
-        ymax = ymin + box_h
-        output_bbox = [xmin, ymin, xmax, ymax]
-        return output_bbox
+    def _reformat_bboxes(boxes: np.ndarray, img_sizes: np.ndarray) -> np.ndarray:
+        """Convert an ``(N, 4)`` array of relative ``[xmin, ymin, width, height]`` boxes to absolute ``[xmin, ymin,
+        xmax, ymax]`` boxes, given the ``(N, 2)`` array of ``[width, height]`` image sizes."""
+        boxes *= np.tile(img_sizes, 2)
+        boxes[:, 2:] += boxes[:, :2]
+        return boxes
 
 
 class ObjectDetectionFiftyOneInput(IceVisionInput):
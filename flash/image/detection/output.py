@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
 
+import numpy as np
+import torch
 from pytorch_lightning.utilities import rank_zero_warn
 
 from flash.core.data.io.classification_input import ClassificationState
@@ -29,6 +31,16 @@ else:
     fo = None
 
 
+def _to_list(values: Sequence[Any]) -> List[Any]:
+    """Convert a sequence of scalars (Python numbers, NumPy scalars or zero-dimensional tensors) to a list of Python
+    numbers, moving tensors to the host with a single copy."""
+    if isinstance(values, (torch.Tensor, np.ndarray)):
+        return values.tolist()
+    if len(values) > 0 and all(isinstance(value, torch.Tensor) for value in values):
+        return torch.stack(list(values)).tolist()
+    return [value.tolist() if isinstance(value, (torch.Tensor, np.generic)) else value for value in values]
+
+
 class FiftyOneDetectionLabelsOutput(Output):
     """A :class:`.Output` which converts model outputs to FiftyOne detection format.
 
@@ -78,25 +90,30 @@ class FiftyOneDetectionLabelsOutput(Output):
 
         preds = sample[DataKeys.PREDS]
 
-        for bbox, label, score in zip(preds["bboxes"], preds["labels"], preds["scores"]):
-            confidence = score.tolist()
+        bboxes, pred_labels, scores = preds["bboxes"], preds["labels"], _to_list(preds["scores"])
 
-            if self.threshold is not None and confidence < self.threshold:
-                continue
+        if self.threshold is not None:
+            # Drop the rejected candidates before converting the rest of their predictions
+            keep = [i for i, score in enumerate(scores) if score >= self.threshold]
+            bboxes = [bboxes[i] for i in keep]
+            pred_labels = [pred_labels[i] for i in keep]
+            scores = [scores[i] for i in keep]
 
-            xmin, ymin, box_width, box_height = bbox["xmin"], bbox["ymin"], bbox["width"], bbox["height"]
-            box = [
-                (xmin / width).item(),
-                (ymin / height).item(),
-                (box_width / width).item(),
-                (box_height / height).item(),
-            ]
+        # Convert the predictions to Python numbers once rather than calling ``.item()`` for each value
+        xmins, ymins, box_widths, box_heights = (
+            _to_list([bbox[key] for bbox in bboxes]) for key in ("xmin", "ymin", "width", "height")
+        )
 
-            label = label.item()
-            if labels is not None:
-                label = labels[label]
-            else:
-                label = str(int(label))
+        # Resolve the label strings up front so that the loop below doesn't branch on ``labels``
+        if labels is not None:
+            label_strs = [labels[label] for label in _to_list(pred_labels)]
+        else:
+            label_strs = [str(int(label)) for label in _to_list(pred_labels)]
+
+        for xmin, ymin, box_width, box_height, label, confidence in zip(
+            xmins, ymins, box_widths, box_heights, label_strs, scores
+        ):
+            box = [xmin / width, ymin / height, box_width / width, box_height / height]
 
             detections.append(
                 fo.Detection(
@@ -47,8 +47,15 @@ if _KORNIA_AVAILABLE:
 class SemanticSegmentationOutputTransform(OutputTransform):
     def per_sample_transform(self, sample: Any) -> Any:
         resize = K.geometry.Resize(sample[DataKeys.METADATA]["size"], interpolation="bilinear")
-        sample[DataKeys.PREDS] = resize(sample[DataKeys.PREDS])
-        sample[DataKeys.INPUT] = resize(sample[DataKeys.INPUT])
+        preds, input_ = sample[DataKeys.PREDS], sample[DataKeys.INPUT]
+        if preds.shape[-2:] == input_.shape[-2:] and preds.dtype == input_.dtype:
+            # Resize the predictions and the input together with a single interpolation
+            sample[DataKeys.PREDS], sample[DataKeys.INPUT] = resize(torch.cat([preds, input_], dim=-3)).split(
+                [preds.shape[-3], input_.shape[-3]], dim=-3
+            )
+        else:
+            sample[DataKeys.PREDS] = resize(preds)
+            sample[DataKeys.INPUT] = resize(input_)
         return super().per_sample_transform(sample)
 
 
@@ -162,8 +169,8 @@ class SemanticSegmentation(ClassificationTask):
 
         # some frameworks like torchvision return a dict.
         # In particular, torchvision segmentation models return the output logits
-        # in the key `out`.
-        if _isinstance(res, Dict[str, torch.Tensor]):
+        # in the key `out`. The cheap `isinstance` check skips the typed check for plain tensor outputs.
+        if isinstance(res, dict) and _isinstance(res, Dict[str, torch.Tensor]):
             res = res["out"]
 
         return res
@@ -187,8 +194,10 @@ class SemanticSegmentation(ClassificationTask):
         input_cls: Optional[Type[ServeInput]] = SemanticSegmentationDeserializer,
         transform: INPUT_TRANSFORM_TYPE = SemanticSegmentationInputTransform,
         transform_kwargs: Optional[Dict] = None,
+        torch_compile: bool = False,
+        quantize: bool = False,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs)
+        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, torch_compile, quantize)
 
     @staticmethod
     def _ci_benchmark_fn(history: List[Dict[str, Any]]):
@@ -135,7 +135,16 @@ class TabularRegressor(RegressionTask):
         transform: INPUT_TRANSFORM_TYPE = InputTransform,
         transform_kwargs: Optional[Dict] = None,
         parameters: Optional[Dict[str, Any]] = None,
+        torch_compile: bool = False,
+        quantize: bool = False,
     ) -> Composition:
         return super().serve(
-            host, port, sanity_check, partial(input_cls, parameters=parameters), transform, transform_kwargs
+            host,
+            port,
+            sanity_check,
+            partial(input_cls, parameters=parameters),
+            transform,
+            transform_kwargs,
+            torch_compile,
+            quantize,
         )
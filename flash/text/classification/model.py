@@ -142,5 +142,7 @@ class TextClassifier(ClassificationTask):
         input_cls: Optional[Type[ServeInput]] = TextDeserializer,
         transform: INPUT_TRANSFORM_TYPE = TransformersInputTransform,
         transform_kwargs: Optional[Dict] = None,
+        torch_compile: bool = False,
+        quantize: bool = False,
     ) -> Composition:
-        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs)
+        return super().serve(host, port, sanity_check, input_cls, transform, transform_kwargs, torch_compile, quantize)
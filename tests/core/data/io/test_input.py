@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from copy import deepcopy
+
 import pytest
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
@@ -81,3 +83,61 @@ def test_serve_input():
 
     serve_input = CustomServeInput2()
     assert serve_input._call_load_sample(1) == 2
+
+
+def test_load_sample_resolution_follows_running_stage():
+    class CustomInput(Input):
+        @staticmethod
+        def load_sample(sample):
+            return sample
+
+        @staticmethod
+        def train_load_sample(sample):
+            return sample + 1
+
+    input = CustomInput(RunningStage.TRAINING, [1, 2, 3])
+    assert input[0] == 2
+
+    input.running_stage = RunningStage.PREDICTING
+    assert input[0] == 1
+
+
+def test_load_sample_copy():
+    sample = {"input": 1}
+
+    input = Input(RunningStage.TRAINING, [sample])
+    assert input[0] is sample
+
+    class CustomInput(Input):
+        def load_sample(self, sample):
+            sample["input"] += 1
+            return sample
+
+    input = CustomInput(RunningStage.TRAINING, [sample])
+    assert input[0] == {"input": 2}
+    assert sample == {"input": 1}
+
+
+def test_load_sample_copy_instance_hook():
+    sample = {"input": 1}
+
+    def load_sample(sample):
+        sample["input"] += 1
+        return sample
+
+    input = Input(RunningStage.TRAINING, [sample])
+    assert input[0] is sample
+
+    input.load_sample = load_sample
+    assert input[0] == {"input": 2}
+    assert sample == {"input": 1}
+
+
+def test_input_deepcopy():
+    input = Input(RunningStage.TRAINING, [{"input": 1}])
+    input_copy = deepcopy(input)
+
+    assert input_copy.data == input.data
+    assert input_copy.data is not input.data
+    assert input_copy.transform is input.transform
+    assert input_copy._data_pipeline_state is input._data_pipeline_state
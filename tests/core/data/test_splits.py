@@ -45,6 +45,13 @@ def test_split_dataset():
     split_dataset.is_passed_down = True
     assert not split_dataset.dataset.is_passed_down
 
+    split_dataset.dataset.__custom__ = True
+    assert not hasattr(split_dataset, "__custom__")
+
+    split_dataset = SplitDataset(range(10), indices=[3, 1, 3])
+    assert list(split_dataset) == [1, 3]
+    assert len(SplitDataset(range(10), indices=[])) == 0
+
 
 def test_misconfiguration():
     with pytest.raises(MisconfigurationException, match="[0, 99]"):
@@ -19,6 +19,7 @@ import pytest
 import torch
 
 from flash.core.data.utilities.classification import (
+    _as_numeric_array,
     get_target_details,
     get_target_formatter,
     get_target_mode,
@@ -33,6 +34,7 @@ cases = [
     Case([0, 1, 2], [0, 1, 2], TargetMode.SINGLE_NUMERIC, None, 3),
     Case([[1, 0, 0], [0, 1, 0], [0, 0, 1]], [0, 1, 2], TargetMode.SINGLE_BINARY, None, 3),
     Case(["blue", "green", "red"], [0, 1, 2], TargetMode.SINGLE_TOKEN, ["blue", "green", "red"], 3),
+    Case([[1.0, 0.0], [0.0, 1.0]], [0, 1], TargetMode.SINGLE_BINARY, None, 2),
     # Multi
     Case([[0, 1], [1, 2], [2, 0]], [[1, 1, 0], [0, 1, 1], [1, 0, 1]], TargetMode.MULTI_NUMERIC, None, 3),
     Case([[1, 1, 0], [0, 1, 1], [1, 0, 1]], [[1, 1, 0], [0, 1, 1], [1, 0, 1]], TargetMode.MULTI_BINARY, None, 3),
@@ -108,6 +110,9 @@ cases = [
     Case(torch.tensor([[0], [1]]), [0, 1], TargetMode.SINGLE_NUMERIC, None, 2),
     Case(torch.tensor([0, 1, 2]), [0, 1, 2], TargetMode.SINGLE_NUMERIC, None, 3),
     Case(np.array([0, 1, 2]), [0, 1, 2], TargetMode.SINGLE_NUMERIC, None, 3),
+    Case(np.array([[1, 0], [0, 1]]), [0, 1], TargetMode.SINGLE_BINARY, None, 2),
+    Case(torch.tensor([[0, 0, 1], [1, 0, 0]]), [2, 0], TargetMode.SINGLE_BINARY, None, 3),
+    Case(torch.tensor([[1, 1, 0], [0, 1, 1]]), [[1, 1, 0], [0, 1, 1]], TargetMode.MULTI_BINARY, None, 3),
 ]
 
 
@@ -149,3 +154,42 @@ def test_speed(case):
     end = time.perf_counter()
 
     assert (end - start) / len(targets) < 1e-5  # 0.01ms per target
+
+
+def test_get_target_mode_errors():
+    with pytest.raises(ValueError, match="at least one target"):
+        get_target_mode([])
+
+    with pytest.raises(ValueError, match="inconsistent target modes"):
+        get_target_mode(["blue", "green", "red", [0, 1]])
+
+
+@pytest.mark.parametrize(
+    "targets, target_mode",
+    [
+        ((target for target in [0, 2, 1]), TargetMode.SINGLE_NUMERIC),
+        ({0, 2, 1}, TargetMode.SINGLE_NUMERIC),
+        ({"blue": 0, "green": 1}.keys(), TargetMode.SINGLE_TOKEN),
+        (iter([[0, 1], [1, 0]]), TargetMode.SINGLE_BINARY),
+    ],
+)
+def test_get_target_mode_iterable(targets, target_mode):
+    assert get_target_mode(targets) is target_mode
+
+
+def test_as_numeric_array():
+    assert _as_numeric_array([[0, 1], [1, 0]]).shape == (2, 2)
+    assert _as_numeric_array(torch.tensor([0, 1])).tolist() == [0, 1]
+    assert _as_numeric_array(["blue", "green"]) is None
+    # NumPy can't convert tensors on a non-CPU device (e.g. CUDA) and raises a ``TypeError``
+    assert _as_numeric_array([torch.tensor(1.0, device="meta"), torch.tensor(0.0, device="meta")]) is None
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Test requires a GPU.")
+def test_cuda_tensor_targets():
+    targets = [torch.tensor(0, device="cuda"), torch.tensor(2, device="cuda")]
+    assert get_target_mode(targets) is TargetMode.SINGLE_NUMERIC
+    assert get_target_details(targets, TargetMode.SINGLE_NUMERIC) == (None, 3)
+
+    targets = [torch.tensor([0, 1], device="cuda"), torch.tensor([1, 0], device="cuda")]
+    assert get_target_mode(targets) is TargetMode.SINGLE_BINARY
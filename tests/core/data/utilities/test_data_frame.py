@@ -0,0 +1,47 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from flash.core.data.utilities.data_frame import read_csv
+from flash.core.utilities.imports import _PANDAS_GREATER_EQUAL_1_4_0, _PYARROW_AVAILABLE
+
+
+@pytest.mark.parametrize(
+    "engine",
+    [
+        None,
+        pytest.param(
+            "pyarrow",
+            marks=pytest.mark.skipif(
+                not (_PYARROW_AVAILABLE and _PANDAS_GREATER_EQUAL_1_4_0), reason="pyarrow isn't installed."
+            ),
+        ),
+    ],
+)
+def test_read_csv(tmpdir, engine):
+    csv_file = str(tmpdir / "data.csv")
+    with open(csv_file, "w") as f:
+        f.write("image,target,other\nimage_1.png,Ants,0\nimage_2.png,Bees,1\n")
+
+    data_frame = read_csv(csv_file, usecols=["image", "target"], engine=engine)
+    assert list(data_frame.columns) == ["image", "target"]
+    assert data_frame["target"].tolist() == ["Ants", "Bees"]
+
+
+@pytest.mark.parametrize("pyarrow_available, pandas_greater_equal_1_4_0", [(False, True), (True, False)])
+def test_read_csv_pyarrow_not_available(tmpdir, monkeypatch, pyarrow_available, pandas_greater_equal_1_4_0):
+    monkeypatch.setattr("flash.core.data.utilities.data_frame._PYARROW_AVAILABLE", pyarrow_available)
+    monkeypatch.setattr("flash.core.data.utilities.data_frame._PANDAS_GREATER_EQUAL_1_4_0", pandas_greater_equal_1_4_0)
+    with pytest.raises(ModuleNotFoundError, match="requires `pyarrow` and `pandas>=1.4`"):
+        read_csv(str(tmpdir / "data.csv"), engine="pyarrow")
@@ -0,0 +1,51 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+from flash.core.data.utilities.paths import filter_valid_files, make_dataset
+
+
+def test_make_dataset(tmpdir):
+    for target_class in ["b", "a", "c10", "c2"]:
+        os.makedirs(os.path.join(tmpdir, target_class, "nested"))
+        for fname in ["2.png", "1.png", "ignored.txt", os.path.join("nested", "0.png")]:
+            open(os.path.join(tmpdir, target_class, fname), "w").close()
+
+    files, targets = make_dataset(tmpdir, extensions=(".png",))
+
+    expected_classes = ["a", "b", "c2", "c10"]
+    assert targets == [target_class for target_class in expected_classes for _ in range(3)]
+    assert files == [
+        os.path.join(tmpdir, target_class, fname)
+        for target_class in expected_classes
+        for fname in ["1.png", "2.png", os.path.join("nested", "0.png")]
+    ]
+
+
+def test_make_dataset_no_subdirs(tmpdir):
+    open(os.path.join(tmpdir, "1.png"), "w").close()
+
+    files, targets = make_dataset(tmpdir, extensions=(".png",))
+
+    assert files == [os.path.join(tmpdir, "1.png")]
+    assert targets is None
+
+
+def test_filter_valid_files():
+    files = ["a.png", "b.txt", "c.JPG", "d"]
+    targets = [0, 1, 2, 3]
+
+    assert filter_valid_files(files, valid_extensions=(".png", ".jpg")) == ["a.png", "c.JPG"]
+    assert filter_valid_files(files, targets, valid_extensions=(".png", ".jpg")) == (["a.png", "c.JPG"], [0, 2])
+    assert filter_valid_files(files, targets, valid_extensions=(".npy",)) == ([], [])
@@ -0,0 +1,35 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from flash.core.data.io.input import DataKeys
+from flash.core.data.utilities.samples import to_samples
+
+
+def test_to_samples():
+    samples = to_samples(np.arange(3), ["a", "b", "c"])
+    assert len(samples) == 3
+    assert samples[0] == {DataKeys.INPUT: 0, DataKeys.TARGET: "a"}
+    assert samples[-1] == {DataKeys.INPUT: 2, DataKeys.TARGET: "c"}
+    assert list(samples[1:]) == [{DataKeys.INPUT: 1, DataKeys.TARGET: "b"}, {DataKeys.INPUT: 2, DataKeys.TARGET: "c"}]
+
+    with pytest.raises(IndexError):
+        samples[3]
+
+    # Samples are created on request so mutating one doesn't change the underlying data
+    samples[0][DataKeys.INPUT] = 10
+    assert samples[0][DataKeys.INPUT] == 0
+
+    assert list(to_samples(x for x in range(2))) == [{DataKeys.INPUT: 0}, {DataKeys.INPUT: 1}]
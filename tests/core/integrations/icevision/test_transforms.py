@@ -0,0 +1,44 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from flash.core.integrations.icevision.transforms import _mask_array_from_icevision
+from flash.core.utilities.imports import _ICEVISION_AVAILABLE
+
+if _ICEVISION_AVAILABLE:
+    from icevision.core.mask import EncodedRLEs, MaskArray
+
+
+@pytest.mark.skipif(not _ICEVISION_AVAILABLE, reason="icevision is not installed.")
+def test_mask_array_from_icevision():
+    record = SimpleNamespace(height=4, width=5)
+    masks = np.zeros((2, 4, 5), dtype=np.uint8)
+    masks[0, :2] = 1
+    masks[1, :, 3:] = 1
+
+    assert np.array_equal(_mask_array_from_icevision(MaskArray(masks), record), masks)
+    assert np.array_equal(_mask_array_from_icevision(MaskArray(masks).to_erles(4, 5), record), masks)
+
+
+@pytest.mark.skipif(not _ICEVISION_AVAILABLE, reason="icevision is not installed.")
+def test_mask_array_from_icevision_empty():
+    record = SimpleNamespace(height=4, width=5)
+
+    mask_array = _mask_array_from_icevision(EncodedRLEs(), record)
+
+    assert mask_array.shape == (0, 4, 5)
+    assert mask_array.dtype == np.uint8
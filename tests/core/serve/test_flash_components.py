@@ -0,0 +1,60 @@
+from unittest import mock
+
+import pytest
+import torch
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from torch import nn
+
+from flash import Task
+from flash.core.data.io.input import DataKeys, ServeInput
+from flash.core.utilities.imports import _TORCH_GREATER_EQUAL_2_0
+from tests.helpers.utils import _SERVE_TESTING
+
+if _SERVE_TESTING:
+    from flash.core.serve.flash_components import build_flash_serve_model_component
+
+
+class TensorServeInput(ServeInput):
+    @staticmethod
+    def serve_load_sample(sample):
+        return {DataKeys.INPUT: torch.tensor(sample)}
+
+    @property
+    def example_input(self) -> str:
+        return "[0.0, 0.0, 0.0, 0.0]"
+
+
+def _model() -> Task:
+    return Task(nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2)))
+
+
+@pytest.mark.skipif(not _SERVE_TESTING, reason="serve libraries aren't installed.")
+@pytest.mark.skipif(not _TORCH_GREATER_EQUAL_2_0, reason="torch.compile requires torch>=2.0.")
+def test_build_flash_serve_model_component_torch_compile():
+    model = _model()
+
+    with mock.patch("torch.compile", side_effect=lambda fn, **kwargs: fn) as compile:
+        comp = build_flash_serve_model_component(model, TensorServeInput(), torch_compile=True)
+
+    compile.assert_called_once_with(model.predict_step, mode="max-autotune")
+    assert comp.predict_step == model.predict_step
+
+
+@pytest.mark.skipif(not _SERVE_TESTING, reason="serve libraries aren't installed.")
+@pytest.mark.skipif(_TORCH_GREATER_EQUAL_2_0, reason="torch.compile is available.")
+def test_build_flash_serve_model_component_torch_compile_requires_torch_2():
+    with pytest.raises(MisconfigurationException, match="torch>=2.0"):
+        build_flash_serve_model_component(_model(), TensorServeInput(), torch_compile=True)
+
+
+@pytest.mark.skipif(not _SERVE_TESTING, reason="serve libraries aren't installed.")
+def test_build_flash_serve_model_component_quantize():
+    model = _model()
+
+    comp = build_flash_serve_model_component(model, TensorServeInput(), quantize=True)
+
+    assert all(isinstance(comp.model.model[i], torch.nn.quantized.dynamic.Linear) for i in (0, 2))
+
+    # The caller's model is left unchanged
+    assert comp.model is not model
+    assert all(type(model.model[i]) is nn.Linear for i in (0, 2))
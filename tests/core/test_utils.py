@@ -16,7 +16,7 @@ import os
 import pytest
 
 from flash.core.data.utils import download_data
-from flash.core.utilities.apply_func import get_callable_dict, get_callable_name
+from flash.core.utilities.apply_func import _is_overridden, get_callable_dict, get_callable_name
 
 # ======== Mock functions ========
 
@@ -51,6 +51,32 @@ def test_get_callable_dict():
     assert type(d["one"]) is A
     assert d["two"] == b
 
+    with pytest.raises(TypeError, match="Expected a callable"):
+        get_callable_dict(1)
+
+
+def test_is_overridden():
+    class B(A):
+        def __call__(self, x):
+            return False
+
+    assert not _is_overridden("__call__", A(), A)
+    assert _is_overridden("__call__", B(), A)
+    assert not _is_overridden("missing", B(), A)
+
+    a = A()
+    a.__call__ = b
+    assert _is_overridden("__call__", a, A)
+    assert not _is_overridden("__call__", A(), A)
+
+    # Methods patched on the class after a lookup are picked up
+    class C(A):
+        pass
+
+    assert not _is_overridden("__call__", C(), A)
+    C.__call__ = b
+    assert _is_overridden("__call__", C(), A)
+
 
 @pytest.mark.parametrize("file", ["titanic.zip", "titanic.tar.gz", "titanic.tar.bz2"])
 def test_download_data(tmpdir, file):
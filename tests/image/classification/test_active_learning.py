@@ -26,9 +26,13 @@ from flash.core.classification import ProbabilitiesOutput
 from flash.core.utilities.imports import _BAAL_AVAILABLE
 from flash.image import ImageClassificationData, ImageClassifier
 from flash.image.classification.integrations.baal import ActiveLearningDataModule, ActiveLearningLoop
+from flash.image.classification.integrations.baal.data import _bald_uncertainties, _scores_like_bald
 from tests.helpers.utils import _IMAGE_TESTING
 from tests.image.classification.test_data import _rand_image
 
+if _BAAL_AVAILABLE:
+    from baal.active.heuristics import BALD, Entropy
+
 # ======== Mock functions ========
 
 
@@ -153,3 +157,47 @@ def test_no_validation_loop(simple_datamodule):
 
     # Check that we can finetune without val_set
     trainer.finetune(model, datamodule=active_learning_dm, strategy="no_freeze")
+
+
+def _random_probabilities(num_samples: int = 16, num_classes: int = 5, num_iterations: int = 4) -> torch.Tensor:
+    probabilities = torch.randn(num_samples, num_classes, num_iterations).softmax(1)
+    # some samples are predicted with certainty, giving zero probabilities
+    probabilities[:4] = 0
+    probabilities[:4, 0, :2] = 1
+    probabilities[:4, 1, 2:] = 1
+    return probabilities
+
+
+def test_bald_uncertainties():
+    # two iterations which are certain of different classes
+    probabilities = torch.tensor([[[1.0, 0.0], [0.0, 1.0]], [[1.0, 1.0], [0.0, 0.0]]])
+    np.testing.assert_allclose(_bald_uncertainties(probabilities), [math.log(2), 0])
+
+    # logits are converted to probabilities
+    seed_everything(42)
+    logits = torch.randn(16, 5, 4)
+    np.testing.assert_allclose(_bald_uncertainties(logits), _bald_uncertainties(logits.double().softmax(1)))
+
+
+@pytest.mark.skipif(not _BAAL_AVAILABLE, reason="baal library isn't installed.")
+def test_bald_uncertainties_parity():
+    seed_everything(42)
+    probabilities = _random_probabilities()
+    expected = BALD().get_uncertainties(probabilities.numpy())
+    np.testing.assert_allclose(_bald_uncertainties(probabilities), expected, rtol=1e-5, atol=1e-6)
+
+    logits = torch.randn(16, 5, 4)
+    expected = BALD().get_uncertainties(logits.numpy())
+    np.testing.assert_allclose(_bald_uncertainties(logits), expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.skipif(not _BAAL_AVAILABLE, reason="baal library isn't installed.")
+def test_scores_like_bald():
+    class CustomBALD(BALD):
+        def compute_score(self, predictions, target_predictions=None):
+            return -super().compute_score(predictions)
+
+    assert _scores_like_bald(BALD())
+    assert _scores_like_bald(type("MyBALD", (BALD,), {})())
+    assert not _scores_like_bald(CustomBALD())
+    assert not _scores_like_bald(Entropy())
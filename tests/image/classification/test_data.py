@@ -12,17 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import csv
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Tuple
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 import torch.nn as nn
 
 from flash.core.data.io.input import DataKeys
 from flash.core.data.transforms import ApplyToKeys
+from flash.core.data.utilities.data_frame import read_csv
 from flash.core.utilities.imports import (
     _FIFTYONE_AVAILABLE,
     _IMAGE_AVAILABLE,
@@ -31,6 +35,7 @@ from flash.core.utilities.imports import (
     _TORCHVISION_AVAILABLE,
 )
 from flash.image import ImageClassificationData, ImageClassificationInputTransform
+from flash.image.classification.input import ImageClassificationCSVInput, ImageClassificationDataFrameInput
 from tests.helpers.utils import _IMAGE_TESTING
 
 if _TORCHVISION_AVAILABLE:
@@ -511,6 +516,23 @@ def test_from_csv_single_target(single_target_csv):
     assert labels.shape == (2,)
 
 
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_from_csv_predict_images_root(single_target_csv, image_tmpdir):
+    img_data = ImageClassificationData.from_csv(
+        "image",
+        "target",
+        predict_file=single_target_csv,
+        predict_images_root=str(image_tmpdir),
+        batch_size=2,
+        num_workers=0,
+    )
+
+    # check predict data
+    data = next(iter(img_data.predict_dataloader()))
+    imgs = data[DataKeys.INPUT]
+    assert imgs.shape == (2, 3, 196, 196)
+
+
 @pytest.fixture
 def multi_target_csv(image_tmpdir):
     with open(image_tmpdir / "metadata.csv", "w") as csvfile:
@@ -539,6 +561,75 @@ def test_from_csv_multi_target(multi_target_csv):
     assert labels.shape == (2, 2)
 
 
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_from_csv_reads_files_once(single_target_csv):
+    with mock.patch("flash.image.classification.input.read_csv", side_effect=read_csv) as mock_read_csv:
+        ImageClassificationData.from_csv(
+            "image",
+            "target",
+            train_file=single_target_csv,
+            val_file=single_target_csv,
+            test_file=single_target_csv,
+            batch_size=2,
+            num_workers=0,
+            csv_engine="c",
+        )
+        assert mock_read_csv.call_count == 1
+        assert mock_read_csv.call_args.kwargs["engine"] == "c"
+
+        # the parsed files are not shared between calls, so modified files are read again
+        ImageClassificationData.from_csv(
+            "image",
+            "target",
+            train_file=single_target_csv,
+            batch_size=2,
+            num_workers=0,
+        )
+        assert mock_read_csv.call_count == 2
+
+
+class OldSignatureCSVInput(ImageClassificationCSVInput):
+    def load_data(self, csv_file, input_key, target_keys=None, root=None, resolver=None):
+        return super().load_data(csv_file, input_key, target_keys, root, resolver)
+
+
+class CustomCSVInput(ImageClassificationDataFrameInput):
+    def load_data(self, csv_file, input_key, target_keys=None, root=None, resolver=None):
+        return super().load_data(pd.read_csv(csv_file), input_key, target_keys, os.path.dirname(csv_file), resolver)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.parametrize("input_cls", [OldSignatureCSVInput, CustomCSVInput])
+@pytest.mark.parametrize("csv_engine", [None, "c"])
+def test_from_csv_custom_input_cls(single_target_csv, input_cls, csv_engine):
+    img_data = ImageClassificationData.from_csv(
+        "image",
+        "target",
+        train_file=single_target_csv,
+        val_file=single_target_csv,
+        batch_size=2,
+        num_workers=0,
+        input_cls=input_cls,
+        csv_engine=csv_engine,
+    )
+    assert len(img_data.train_dataset) == 2
+    assert len(img_data.val_dataset) == 2
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_from_csv_pyarrow_engine_not_available(single_target_csv, monkeypatch):
+    monkeypatch.setattr("flash.core.data.utilities.data_frame._PANDAS_GREATER_EQUAL_1_4_0", False)
+    with pytest.raises(ModuleNotFoundError, match="requires `pyarrow` and `pandas>=1.4`"):
+        ImageClassificationData.from_csv(
+            "image",
+            "target",
+            train_file=single_target_csv,
+            batch_size=2,
+            num_workers=0,
+            csv_engine="pyarrow",
+        )
+
+
 @pytest.fixture
 def bad_csv_no_image(image_tmpdir):
     with open(image_tmpdir / "metadata.csv", "w") as csvfile:
@@ -562,6 +653,22 @@ def test_from_bad_csv_no_image(bad_csv_no_image):
         _ = next(iter(img_data.train_dataloader()))
 
 
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.parametrize(
+    "input_key, target_keys", [("file", "target"), ("image", "label"), ("image", ["target", "label"])]
+)
+def test_from_csv_missing_column(bad_csv_no_image, input_key, target_keys):
+    # Only the input and target columns are parsed, so a missing column is reported by ``pd.read_csv``
+    with pytest.raises(ValueError, match="Usecols do not match columns"):
+        ImageClassificationData.from_csv(
+            input_key,
+            target_keys,
+            train_file=bad_csv_no_image,
+            batch_size=1,
+            num_workers=0,
+        )
+
+
 @pytest.mark.skipif(not _IMAGE_AVAILABLE, reason="image libraries aren't installed.")
 def test_mixup(single_target_csv):
     @dataclass